@@ -1,7 +1,12 @@
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
 from flasgger import Swagger
 import psycopg2
 from psycopg2.extras import RealDictCursor
+import threading
+import time
+from datetime import datetime, timezone
+from country_index import CountryIndex
+from time_zones import TimeZoneIndex, parse_offset, parse_time_zones
 
 app = Flask(__name__)
 Swagger(app)
@@ -27,6 +32,7 @@ def execute_query(query):
     Returns:
         list: A list of dictionaries representing the query results.
     """
+    connection = None
     try:
         connection = psycopg2.connect(**connection_params)
         cursor = connection.cursor(cursor_factory=RealDictCursor)
@@ -40,6 +46,90 @@ def execute_query(query):
             cursor.close()
             connection.close()
 
+# In-memory indexes over the countries, rebuilt when the dataset changes
+INDEX_CHECK_INTERVAL = 60
+# How soon to try again when the database could not be read
+INDEX_RETRY_INTERVAL = 5
+_index_lock = threading.Lock()
+_indexes = {'version': None, 'next_check': 0.0, 'country_index': None, 'time_zone_index': None}
+
+def get_indexes():
+    """
+    Return the in-memory indexes for the current version of the dataset.
+
+    The dataset version (a hash over the country names and time zones) is
+    checked at most once every INDEX_CHECK_INTERVAL seconds and the indexes
+    are rebuilt only when it changes, so most lookups never touch the database.
+    Databases ingested before the fusuri_utc column existed are indexed by
+    parsing the fus_orar text.
+
+    Returns:
+        dict: The "country_index" and "time_zone_index", which are None if the
+        database is unavailable.
+    """
+    if time.monotonic() < _indexes['next_check']:
+        return _indexes
+    with _index_lock:
+        if time.monotonic() < _indexes['next_check']:
+            return _indexes
+        has_fusuri_utc = execute_query(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = 'countries' AND column_name = 'fusuri_utc';"
+        )
+        columns = "nume, fus_orar, fusuri_utc" if has_fusuri_utc else "nume, fus_orar"
+        result = execute_query(
+            f"SELECT md5(string_agg(concat_ws('|', {columns}), '|' ORDER BY nume)) AS versiune FROM countries;"
+        )
+        if not result:
+            _indexes['next_check'] = time.monotonic() + INDEX_RETRY_INTERVAL
+            return _indexes
+        version = result[0]['versiune']
+        if version != _indexes['version'] or _indexes['country_index'] is None:
+            rows = execute_query(f"SELECT {columns} FROM countries;") or []
+            _indexes['country_index'] = CountryIndex(row['nume'] for row in rows)
+            # Rows without structured offsets are parsed from the text
+            _indexes['time_zone_index'] = TimeZoneIndex(
+                (row['nume'].strip(), row.get('fusuri_utc') or parse_time_zones(row['fus_orar']))
+                for row in rows
+            )
+            _indexes['version'] = version
+        _indexes['next_check'] = time.monotonic() + INDEX_CHECK_INTERVAL
+        return _indexes
+
+def get_country_index():
+    """
+    Return the name search index for the current version of the dataset.
+
+    Returns:
+        CountryIndex: The index, or None if the database is unavailable.
+    """
+    return get_indexes()['country_index']
+
+def get_time_zone_index():
+    """
+    Return the time zone index for the current version of the dataset.
+
+    Returns:
+        TimeZoneIndex: The index, or None if the database is unavailable.
+    """
+    return get_indexes()['time_zone_index']
+
+@app.after_request
+def add_etag(response):
+    """
+    Tag JSON responses with an ETag so clients can revalidate their cache.
+
+    Args:
+        response (Response): The response returned by the endpoint.
+
+    Returns:
+        Response: The same response, or an empty 304 if the client's copy is current.
+    """
+    if request.method == 'GET' and response.status_code == 200 and response.is_json:
+        response.add_etag()
+        response = response.make_conditional(request)
+    return response
+
 @app.route('/tara/<nume>', methods=['GET'])
 def tara(nume):
     """
@@ -171,5 +261,189 @@ def tari_cu_fus_orar(fus_orar):
     result = execute_query(query)
     return jsonify(result)
 
+@app.route('/autocomplete/<prefix>', methods=['GET'])
+def autocomplete(prefix):
+    """
+    Endpoint to complete a partially typed country name.
+
+    Accents and case are ignored, common alternative names (e.g. "Ivory Coast")
+    are included and any word of the name can be completed.
+
+    ---
+    parameters:
+      - name: prefix
+        in: path
+        type: string
+        required: true
+        description: The beginning of the country name.
+      - name: limita
+        in: query
+        type: integer
+        required: false
+        description: Maximum number of results (default 10).
+    responses:
+      200:
+        description: A list of countries whose name starts with the prefix.
+        examples:
+          [{"nume": "Country1"}, {"nume": "Country2"}]
+      400:
+        description: The limit is negative.
+    """
+    limita = request.args.get('limita', 10, type=int)
+    if limita < 0:
+        return jsonify({'error': f'Invalid limit: {limita}'}), 400
+    index = get_country_index()
+    if index is None:
+        return jsonify([])
+    return jsonify([{'nume': nume} for nume in index.autocomplete(prefix, limita)])
+
+@app.route('/cauta/<nume>', methods=['GET'])
+def cauta(nume):
+    """
+    Endpoint to search for countries by name, tolerating typos.
+
+    ---
+    parameters:
+      - name: nume
+        in: path
+        type: string
+        required: true
+        description: The country name to search for, possibly misspelled.
+      - name: distanta
+        in: query
+        type: integer
+        required: false
+        description: Maximum edit distance (default one per four letters).
+      - name: limita
+        in: query
+        type: integer
+        required: false
+        description: Maximum number of results (default 10).
+    responses:
+      200:
+        description: A list of countries ordered by edit distance.
+        examples:
+          [{"nume": "Country1", "distanta": 1, "potrivire": "country1"}]
+      400:
+        description: The edit distance or the limit is negative.
+    """
+    distanta = request.args.get('distanta', None, type=int)
+    limita = request.args.get('limita', 10, type=int)
+    if distanta is not None and distanta < 0:
+        return jsonify({'error': f'Invalid edit distance: {distanta}'}), 400
+    if limita < 0:
+        return jsonify({'error': f'Invalid limit: {limita}'}), 400
+    index = get_country_index()
+    if index is None:
+        return jsonify([])
+    return jsonify(index.search(nume, distanta, limita))
+
+@app.route('/utc/<offset>', methods=['GET'])
+def tari_la_utc(offset):
+    """
+    Endpoint to get countries using the specified UTC offset.
+
+    ---
+    parameters:
+      - name: offset
+        in: path
+        type: string
+        required: true
+        description: The UTC offset, e.g. +5:30, -3 or UTC+2.
+    responses:
+      200:
+        description: A list of countries using the offset, as standard or summer (DST) time.
+        examples:
+          [{"nume": "Country1", "tip": "standard"}, {"nume": "Country2", "tip": "dst"}]
+      400:
+        description: The offset could not be parsed or is outside UTC-12:00..UTC+14:00.
+    """
+    minutes = parse_offset(offset)
+    if minutes is None:
+        return jsonify({'error': f'Invalid UTC offset: {offset}'}), 400
+    index = get_time_zone_index()
+    if index is None:
+        return jsonify([])
+    return jsonify(index.at(minutes))
+
+@app.route('/utc/<start>/<end>', methods=['GET'])
+def tari_intre_utc(start, end):
+    """
+    Endpoint to get countries using any UTC offset in the specified range.
+
+    ---
+    parameters:
+      - name: start
+        in: path
+        type: string
+        required: true
+        description: The lowest UTC offset, e.g. -3.
+      - name: end
+        in: path
+        type: string
+        required: true
+        description: The highest UTC offset, e.g. +1.
+    responses:
+      200:
+        description: A list of countries using an offset in the range, as standard or summer (DST) time.
+        examples:
+          [{"nume": "Country1", "tip": "standard"}, {"nume": "Country2", "tip": "dst"}]
+      400:
+        description: One of the offsets could not be parsed or is outside UTC-12:00..UTC+14:00.
+    """
+    start_minutes = parse_offset(start)
+    end_minutes = parse_offset(end)
+    if start_minutes is None or end_minutes is None:
+        return jsonify({'error': f'Invalid UTC offset range: {start} - {end}'}), 400
+    index = get_time_zone_index()
+    if index is None:
+        return jsonify([])
+    return jsonify(index.between(start_minutes, end_minutes))
+
+@app.route('/ora-locala/<ora>', methods=['GET'])
+def tari_la_ora_locala(ora):
+    """
+    Endpoint to get countries where the local time is currently the specified hour.
+
+    The dataset does not say when summer time is in effect, so by default a
+    country with summer time is matched under both offsets: it is listed with
+    "tip": "standard" when the hour matches its standard offset and with
+    "tip": "dst" when it matches its summer offset, whatever the date. Pass
+    tip=standard or tip=dst to match only one of them.
+
+    ---
+    parameters:
+      - name: ora
+        in: path
+        type: string
+        required: true
+        description: The local time as HH:MM, e.g. 09:00; matches up to HH:MM + 59 minutes.
+      - name: tip
+        in: query
+        type: string
+        required: false
+        description: Match only "standard" or only "dst" offsets.
+    responses:
+      200:
+        description: A list of countries where it is currently the specified hour.
+        examples:
+          [{"nume": "Country1", "tip": "standard"}, {"nume": "Country2", "tip": "dst"}]
+      400:
+        description: The time or the offset kind could not be parsed.
+    """
+    try:
+        local = datetime.strptime(ora, '%H:%M')
+    except ValueError:
+        return jsonify({'error': f'Invalid time: {ora}'}), 400
+    tip = request.args.get('tip')
+    if tip not in (None, 'standard', 'dst'):
+        return jsonify({'error': f'Invalid offset kind: {tip}'}), 400
+    kinds = ('standard', 'dst') if tip is None else (tip,)
+    index = get_time_zone_index()
+    if index is None:
+        return jsonify([])
+    now = datetime.now(timezone.utc)
+    return jsonify(index.local_time(local.hour * 60 + local.minute, now.hour * 60 + now.minute, kinds=kinds))
+
 if __name__ == '__main__':
     app.run(debug=True)
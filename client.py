@@ -1,6 +1,141 @@
 import requests
 import json
 import argparse
+import hashlib
+import itertools
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_URL = 'http://localhost:5000'
+DEFAULT_TIMEOUT = 10
+DEFAULT_CACHE_DIR = '.client_cache'
+
+
+def create_session(pool_size=10, retries=3):
+    """
+    Create a requests session with a keep-alive connection pool and retries.
+
+    Args:
+        pool_size (int): Maximum number of pooled connections to the API.
+        retries (int): Number of retries for connection errors and 5xx responses.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.2,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=['GET'],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class ResponseCache:
+    """
+    On-disk cache of API responses, revalidated with conditional requests.
+
+    Every entry is stored as a JSON file named after the hash of the URL and
+    keeps the ETag / Last-Modified validators next to the decoded body.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, url):
+        """
+        Return the cached entry for the URL, or None if there is none.
+        """
+        try:
+            with open(self._path(url), mode='r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, url, response, data):
+        """
+        Store a response body if the server sent a validator for it.
+        """
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'data': data
+        }
+        if not entry['etag'] and not entry['last_modified']:
+            return
+        # Write to a temporary file first so concurrent workers never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, mode='w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._path(url))
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        Build the If-None-Match / If-Modified-Since headers for a cached entry.
+        """
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+
+def fetch_route(session, route, api_url=API_URL, timeout=DEFAULT_TIMEOUT, cache=None):
+    """
+    Request a single route and describe the outcome.
+
+    Args:
+        session (requests.Session): The session used for the request.
+        route (str): The route of the API endpoint.
+        api_url (str): Base URL of the API.
+        timeout (float): Timeout in seconds for the request.
+        cache (ResponseCache): Optional response cache.
+
+    Returns:
+        dict: The route, HTTP status, whether the body came from the cache,
+        the latency in milliseconds and either the data or an error message.
+    """
+    url = api_url + route
+    entry = cache.get(url) if cache else None
+    record = {'route': route, 'status': None, 'cached': False}
+    start = time.perf_counter()
+    try:
+        r = session.get(url, headers=ResponseCache.conditional_headers(entry), timeout=timeout)
+        record['status'] = r.status_code
+        if r.status_code == 304 and entry:
+            record['cached'] = True
+            record['data'] = entry['data']
+        elif r.status_code == 200:
+            record['data'] = r.json()
+            if cache:
+                cache.put(url, r, record['data'])
+        else:
+            record['error'] = r.text
+    except json.JSONDecodeError as e:
+        record['error'] = f"Error decoding JSON response: {e}"
+    except requests.RequestException as e:
+        record['error'] = str(e)
+    record['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+    return record
+
 
 def get_api_data(route):
     """
@@ -9,30 +144,184 @@ def get_api_data(route):
     Args:
         route (str): The route of the API endpoint.
 
-    Raises:
-        JSONDecodeError: If the response is not valid JSON.
-
     Returns:
         dict: Parsed JSON data received from the API.
     """
-    api_url = 'http://localhost:5000'
-    r = requests.get(api_url + route)
+    with create_session(pool_size=1) as session:
+        record = fetch_route(session, route)
+
+    if 'error' in record:
+        if record['status'] is None:
+            print(f"Error: {record['error']}")
+        else:
+            print(f"Error: {record['status']}, {record['error']}")
+        return None
+    return record['data']
+
+
+def read_routes(source):
+    """
+    Read the routes to request from a file or from stdin.
+
+    Every non-empty line is either a plain route (e.g. /tara/Romania) or a
+    JSON object with a "route" field. Lines starting with # are ignored, and
+    malformed JSON lines are skipped with a message on stderr.
+
+    Args:
+        source (str): Path to the file, or "-" for stdin.
+
+    Returns:
+        list: List of routes.
+    """
+    f = sys.stdin if source == '-' else open(source, mode='r', encoding='utf-8')
+    routes = []
+    try:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith(('{', '[')):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"Skipping malformed JSON line: {e}", file=sys.stderr)
+                    continue
+                route = entry.get('route') if isinstance(entry, dict) else None
+                if not isinstance(route, str) or not route:
+                    print(f"Skipping line without a route: {line}", file=sys.stderr)
+                    continue
+            else:
+                route = line
+            if not route.startswith('/'):
+                route = '/' + route
+            routes.append(route)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+    return routes
+
+
+def run_batch(routes, workers=8, api_url=API_URL, timeout=DEFAULT_TIMEOUT, retries=3, cache=None):
+    """
+    Request all routes concurrently over a shared session.
+
+    Args:
+        routes (list): The routes to request.
+        workers (int): Number of concurrent workers.
+        api_url (str): Base URL of the API.
+        timeout (float): Timeout in seconds for each request.
+        retries (int): Number of retries for each request.
+        cache (ResponseCache): Optional response cache.
+
+    Yields:
+        dict: One record per route, in completion order.
+    """
+    with create_session(pool_size=workers, retries=retries) as session:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fetch_route, session, route, api_url, timeout, cache) for route in routes]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def percentile(sorted_values, p):
+    """
+    Return the p-th percentile of an already sorted list (nearest-rank method).
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_load(routes, rate, duration, workers=8, api_url=API_URL, timeout=DEFAULT_TIMEOUT, retries=0):
+    """
+    Replay the routes against the API at a fixed request rate.
+
+    Requests are issued open-loop, cycling through the routes, so a slow API
+    does not lower the offered load. Latency is measured from the time each
+    request was scheduled to be sent, so time spent waiting for a free worker
+    is included; requests that started more than one send interval late are
+    counted as "late". The response cache is bypassed so every request
+    reaches the server.
+
+    Args:
+        routes (list): The routes to request.
+        rate (float): Requests per second to issue.
+        duration (float): How long to generate load, in seconds.
+        workers (int): Number of concurrent workers.
+        api_url (str): Base URL of the API.
+        timeout (float): Timeout in seconds for each request.
+        retries (int): Number of retries for each request.
+
+    Returns:
+        dict: Offered rate, throughput of successful requests, error and late
+        counts, and latency percentiles in milliseconds.
+    """
+    latencies = []
+    errors = 0
+    late = 0
+    interval = 1 / rate
+    lock = threading.Lock()
+
+    def timed_fetch(session, route, scheduled):
+        nonlocal late, errors
+        if time.perf_counter() - scheduled > interval:
+            with lock:
+                late += 1
+        record = fetch_route(session, route, api_url, timeout)
+        latency = round((time.perf_counter() - scheduled) * 1000, 3)
+        with lock:
+            if 'error' in record:
+                errors += 1
+            else:
+                latencies.append(latency)
+
+    total = int(rate * duration)
+    futures = []
+    with create_session(pool_size=workers, retries=retries) as session:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            for i, route in zip(range(total), itertools.cycle(routes)):
+                scheduled = start + i * interval
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(timed_fetch, session, route, scheduled))
+        elapsed = time.perf_counter() - start
+
+    # A worker that raised never recorded its request, so count it as an error
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            print(f"Error in load test worker: {error!r}", file=sys.stderr)
+            errors += 1
+
+    latencies.sort()
+    return {
+        'requests': total,
+        'errors': errors,
+        'late': late,
+        'elapsed_s': round(elapsed, 3),
+        'offered_rps': rate,
+        'throughput_rps': round(len(latencies) / elapsed, 2) if elapsed else None,
+        'latency_ms': {
+            'min': latencies[0] if latencies else None,
+            'p50': percentile(latencies, 50),
+            'p90': percentile(latencies, 90),
+            'p99': percentile(latencies, 99),
+            'max': latencies[-1] if latencies else None
+        }
+    }
 
-    if r.status_code == 200:
-        try:
-            data = r.json()
-            return data
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON response: {e}")
-    else:
-        print(f"Error: {r.status_code}, {r.text}")
 
 def main():
     """
     Main function to handle command line arguments and call the API.
 
-    Parses the route argument provided via the command line,
-    calls the `get_api_data` function, and prints the parsed JSON response.
+    With a single route, calls the `get_api_data` function and prints the
+    parsed JSON response. With --batch, requests every route read from the
+    file (or stdin) concurrently and prints one NDJSON record per route.
+    Adding --rate turns the batch into a load test and prints a summary.
 
     Raises:
         None
@@ -41,17 +330,48 @@ def main():
         None
     """
     parser = argparse.ArgumentParser(description='Get data from a Flask API endpoint.')
-    parser.add_argument('route', type=str, help='API endpoint route')
+    parser.add_argument('route', type=str, nargs='?', help='API endpoint route')
+    parser.add_argument('--batch', metavar='FILE', help='read routes from FILE ("-" for stdin)')
+    parser.add_argument('--url', default=API_URL, help='base URL of the API')
+    parser.add_argument('--workers', type=int, default=8, help='number of concurrent requests')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='request timeout in seconds')
+    parser.add_argument('--retries', type=int, help='retries for failed requests (default 3, 0 with --rate)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='directory of the response cache')
+    parser.add_argument('--no-cache', action='store_true', help='do not use the response cache')
+    parser.add_argument('--rate', type=float, help='generate load at RATE requests per second')
+    parser.add_argument('--duration', type=float, default=10, help='load test duration in seconds')
 
     args = parser.parse_args()
-    route = args.route
 
-    # Get data from the API
-    api_data = get_api_data(route)
+    if args.batch is None:
+        if args.route is None:
+            parser.error('either a route or --batch is required')
+
+        # Get data from the API
+        api_data = get_api_data(args.route)
+
+        if api_data:
+            # Print the parsed JSON response
+            print(f"Response:\n{json.dumps(api_data, indent=2)}")
+        return
+
+    routes = read_routes(args.batch)
+    if not routes:
+        parser.error('no routes to request')
+
+    if args.rate:
+        # Retries would hide errors and inflate latency, so the load test does not retry by default
+        retries = 0 if args.retries is None else args.retries
+        summary = run_load(routes, args.rate, args.duration, args.workers, args.url, args.timeout, retries)
+        print(json.dumps(summary, indent=2))
+        return
+
+    cache = None if args.no_cache else ResponseCache(args.cache_dir)
+    retries = 3 if args.retries is None else args.retries
+    for record in run_batch(routes, args.workers, args.url, args.timeout, retries, cache):
+        # Stream every result as soon as it arrives
+        print(json.dumps(record), flush=True)
 
-    if api_data:
-        # Print the parsed JSON response
-        print(f"Response:\n{json.dumps(api_data, indent=2)}")
 
 if __name__ == '__main__':
     main()
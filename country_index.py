@@ -0,0 +1,246 @@
+import re
+import unicodedata
+from collections import Counter
+
+# Common alternative names for countries, keyed by the name stored in the database
+ALIASES = {
+    "Burma": ["Myanmar"],
+    "Cabo Verde": ["Cape Verde"],
+    "Côte d'Ivoire": ["Ivory Coast"],
+    "Czechia": ["Czech Republic"],
+    "Democratic People's Republic of Korea": ["North Korea", "DPRK"],
+    "Democratic Republic of the Congo": ["DR Congo", "DRC", "Congo-Kinshasa"],
+    "East Timor": ["Timor-Leste"],
+    "Eswatini": ["Swaziland"],
+    "Georgia(country)": ["Georgia"],
+    "Great Britain": ["United Kingdom", "UK", "Britain", "England"],
+    "Holy See": ["Vatican", "Vatican City"],
+    "Iran": ["Persia"],
+    "Lao People's Democratic Republic": ["Laos"],
+    "Macao": ["Macau"],
+    "Micronesia": ["Federated States of Micronesia"],
+    "North Macedonia": ["Macedonia"],
+    "Republic of China": ["Taiwan"],
+    "Republic of Korea": ["South Korea"],
+    "Republic of the Congo": ["Congo-Brazzaville", "Congo"],
+    "Russian Federation": ["Russia"],
+    "Syrian Arab Republic": ["Syria"],
+    "Türkiye": ["Turkey"],
+    "United Arab Emirates": ["UAE", "Emirates"],
+    "United States of America": ["United States", "USA", "US", "America"],
+    "Viet Nam": ["Vietnam"],
+}
+
+
+def fold(text):
+    """
+    Normalize a name for matching: strip accents, case and punctuation.
+
+    Args:
+        text (str): The original name.
+
+    Returns:
+        str: The folded name, e.g. "Côte d'Ivoire" -> "cote divoire".
+    """
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = text.casefold()
+    # Apostrophes join the word ("d'Ivoire" -> "divoire"), any other punctuation separates words
+    text = re.sub(r"['’`]", "", text)
+    text = re.sub(r"[^\w]+", " ", text)
+    return text.strip()
+
+
+def levenshtein(a, b, max_distance=None):
+    """
+    Compute the edit distance between two strings.
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+        max_distance (int): Optional bound; the computation stops as soon as
+            the distance is known to exceed it.
+
+    Returns:
+        int: Minimum number of insertions, deletions and substitutions,
+        or max_distance + 1 if it exceeds max_distance.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def bigrams(key):
+    """
+    Return the bigrams of a key padded with spaces, e.g. "ab" -> [" a", "ab", "b "].
+    """
+    padded = f" {key} "
+    return [padded[i:i + 2] for i in range(len(padded) - 1)]
+
+
+class PrefixTrie:
+    """
+    Prefix trie over folded names.
+
+    Every word of a name is inserted as a starting point, so "kong" completes
+    "Hong Kong". Each node keeps the ranked list of countries below it, so a
+    lookup only walks the prefix.
+    """
+
+    def __init__(self):
+        self.root = {"children": {}, "ranks": {}}
+
+    def insert(self, key, country):
+        """
+        Insert a folded key for a country.
+        """
+        words = key.split(" ")
+        for start in range(len(words)):
+            # Matches at the beginning of the name rank before matches inside it
+            rank = 0 if start == 0 else 1
+            node = self.root
+            for c in " ".join(words[start:]):
+                node = node["children"].setdefault(c, {"children": {}, "ranks": {}})
+                if rank < node["ranks"].get(country, 2):
+                    node["ranks"][country] = rank
+
+    def freeze(self):
+        """
+        Sort the countries of every node once all keys are inserted.
+        """
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            node["countries"] = sorted(node["ranks"], key=lambda country: (node["ranks"][country], country))
+            stack.extend(node["children"].values())
+
+    def complete(self, prefix, limit=10):
+        """
+        Return the countries with a name or word starting with the prefix.
+        """
+        node = self.root
+        for c in prefix:
+            node = node["children"].get(c)
+            if node is None:
+                return []
+        return node["countries"][:limit]
+
+
+class NGramIndex:
+    """
+    Inverted bigram index over folded names for edit-distance search.
+
+    A single edit changes at most two bigrams, so a key within distance k of
+    the query shares at least len(bigrams) - 2k of them, counting repeated
+    bigrams as often as they occur. Only keys passing this count filter are
+    compared with the (bounded) edit distance.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.postings = {}
+
+    def insert(self, key, country):
+        """
+        Insert a folded key for a country.
+        """
+        key_id = len(self.keys)
+        self.keys.append((key, country))
+        for gram, count in Counter(bigrams(key)).items():
+            self.postings.setdefault(gram, []).append((key_id, count))
+
+    def search(self, key, max_distance):
+        """
+        Return (distance, key, country) for every key within max_distance.
+        """
+        shared = {}
+        for gram, query_count in Counter(bigrams(key)).items():
+            for key_id, count in self.postings.get(gram, ()):
+                shared[key_id] = shared.get(key_id, 0) + min(query_count, count)
+
+        if len(key) + 1 - 2 * max_distance > 0:
+            candidates = shared.items()
+        else:
+            # Short query with a large tolerance: the count filter cannot exclude anything
+            candidates = ((key_id, shared.get(key_id, 0)) for key_id in range(len(self.keys)))
+
+        matches = []
+        for key_id, count in candidates:
+            candidate, country = self.keys[key_id]
+            if abs(len(candidate) - len(key)) > max_distance:
+                continue
+            if count < max(len(candidate), len(key)) + 1 - 2 * max_distance:
+                continue
+            distance = levenshtein(key, candidate, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, candidate, country))
+        return matches
+
+
+class CountryIndex:
+    """
+    In-memory search indexes over the country names of one dataset version.
+    """
+
+    def __init__(self, names):
+        self.trie = PrefixTrie()
+        self.ngrams = NGramIndex()
+        for name in names:
+            country = name.strip()
+            keys = {fold(country)} | {fold(alias) for alias in ALIASES.get(country, [])}
+            for key in keys:
+                if key:
+                    self.trie.insert(key, country)
+                    self.ngrams.insert(key, country)
+        self.trie.freeze()
+
+    def autocomplete(self, prefix, limit=10):
+        """
+        Return up to `limit` country names completing the prefix.
+
+        Args:
+            prefix (str): The typed prefix, with or without accents.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: Country names, matches at the start of the name first.
+        """
+        return self.trie.complete(fold(prefix), max(0, limit))
+
+    def search(self, name, max_distance=None, limit=10):
+        """
+        Return the countries closest to the name by edit distance.
+
+        Args:
+            name (str): The name to search for, possibly misspelled.
+            max_distance (int): Maximum edit distance; by default one typo per four letters.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: Dictionaries with the country, the distance and the matched name,
+            ordered by distance.
+        """
+        key = fold(name)
+        if max_distance is None:
+            max_distance = max(1, len(key) // 4)
+        max_distance = max(0, max_distance)
+        limit = max(0, limit)
+        best = {}
+        for distance, match, country in self.ngrams.search(key, max_distance):
+            if country not in best or distance < best[country][0]:
+                best[country] = (distance, match)
+        ranked = sorted(best.items(), key=lambda item: (item[1][0], item[0]))
+        return [
+            {"nume": country, "distanta": distance, "potrivire": match}
+            for country, (distance, match) in ranked[:limit]
+        ]
@@ -0,0 +1,112 @@
+import io
+import json
+
+import requests
+
+import client
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = json.dumps(data)
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class FakeSession:
+    """
+    Stand-in for requests.Session that answers from a list of responses.
+
+    A response may be an exception, which is raised instead of returned.
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, headers))
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def test_read_routes(tmp_path, capsys):
+    path = tmp_path / "routes.jsonl"
+    path.write_text(
+        "/tara/Romania\n"
+        "top-10-tari-gdp\n"
+        "\n"
+        "# comment\n"
+        '{"route": "/limba/English"}\n'
+        '{"request_id": "user-001"}\n'
+        "{not json\n"
+        "[1, 2]\n",
+        encoding="utf-8"
+    )
+    assert client.read_routes(str(path)) == ["/tara/Romania", "/top-10-tari-gdp", "/limba/English"]
+    assert capsys.readouterr().err.count("Skipping") == 3
+
+
+def test_read_routes_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("/tara/Romania\n"))
+    assert client.read_routes("-") == ["/tara/Romania"]
+
+
+def test_fetch_route_revalidates_cache(tmp_path):
+    cache = client.ResponseCache(str(tmp_path))
+    data = [{"nume": "Romania"}]
+
+    session = FakeSession([FakeResponse(200, data, {"ETag": '"abc"'})])
+    record = client.fetch_route(session, "/tara/Romania", cache=cache)
+    assert record["status"] == 200 and record["data"] == data and not record["cached"]
+    assert cache.get(client.API_URL + "/tara/Romania")["etag"] == '"abc"'
+
+    session = FakeSession([FakeResponse(304)])
+    record = client.fetch_route(session, "/tara/Romania", cache=cache)
+    assert session.requests[0][1] == {"If-None-Match": '"abc"'}
+    assert record["status"] == 304 and record["data"] == data and record["cached"]
+
+
+def test_fetch_route_errors():
+    record = client.fetch_route(FakeSession([FakeResponse(500, "boom")]), "/tara/Romania")
+    assert record["status"] == 500 and "error" in record
+
+    record = client.fetch_route(FakeSession([requests.ConnectionError("refused")]), "/tara/Romania")
+    assert record["status"] is None and record["error"] == "refused"
+
+
+def test_run_load_counts_errors(monkeypatch):
+    session = FakeSession([requests.ConnectionError("refused")])
+    monkeypatch.setattr(client, "create_session", lambda **kwargs: session)
+    summary = client.run_load(["/x"], rate=100, duration=0.1)
+    assert summary["requests"] == 10
+    assert summary["errors"] == 10
+    assert summary["throughput_rps"] == 0
+    assert summary["latency_ms"]["p50"] is None
+
+
+def test_run_load_measures_successes(monkeypatch):
+    session = FakeSession([FakeResponse(200, [])])
+    monkeypatch.setattr(client, "create_session", lambda **kwargs: session)
+    summary = client.run_load(["/x"], rate=100, duration=0.1)
+    assert summary["errors"] == 0
+    assert summary["throughput_rps"] > 0
+    assert summary["latency_ms"]["p50"] is not None
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert [client.percentile(values, p) for p in (50, 90, 99)] == [50, 90, 99]
+    assert client.percentile([], 50) is None
@@ -0,0 +1,66 @@
+import csv
+import random
+
+from country_index import CountryIndex, fold, levenshtein
+
+
+def load_index():
+    with open("countries.csv", mode="r", encoding="utf-8", newline="") as csvfile:
+        names = next(csv.reader(csvfile))
+    return CountryIndex(names)
+
+
+def brute_force(index, key, max_distance):
+    return sorted(
+        (distance, candidate, country)
+        for candidate, country in index.ngrams.keys
+        if (distance := levenshtein(key, candidate, max_distance)) <= max_distance
+    )
+
+
+def test_fold():
+    assert fold("Côte d'Ivoire") == "cote divoire"
+    assert fold("Guinea-Bissau") == "guinea bissau"
+
+
+def test_autocomplete():
+    index = load_index()
+    assert index.autocomplete("Rom") == ["Romania"]
+    assert index.autocomplete("cote") == ["Côte d'Ivoire"]
+    assert index.autocomplete("kong") == ["Hong Kong"]
+
+
+def test_search_repeated_bigrams():
+    index = load_index()
+    assert index.search("aganistan")[0]["nume"] == "Afghanistan"
+    assert index.search("Afganstan")[0]["nume"] == "Afghanistan"
+    assert index.search("Romnia")[0]["nume"] == "Romania"
+
+
+def test_negative_limits_are_clamped():
+    index = load_index()
+    assert index.autocomplete("united", limit=-1) == []
+    assert index.search("Romnia", limit=-1) == []
+    assert index.search("Romania", max_distance=-1) == [{"nume": "Romania", "distanta": 0, "potrivire": "romania"}]
+
+
+def test_search_matches_brute_force():
+    index = load_index()
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz "
+    for candidate, _ in index.ngrams.keys:
+        for _ in range(2):
+            key = list(candidate)
+            for _ in range(rng.randint(1, 2)):
+                i = rng.randrange(len(key) + 1)
+                edit = rng.choice(("insert", "delete", "substitute"))
+                if edit == "insert" or not key:
+                    key.insert(i, rng.choice(letters))
+                elif i < len(key):
+                    if edit == "delete":
+                        del key[i]
+                    else:
+                        key[i] = rng.choice(letters)
+            key = "".join(key)
+            for max_distance in (1, 2, 3):
+                assert sorted(index.ngrams.search(key, max_distance)) == brute_force(index, key, max_distance)
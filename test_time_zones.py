@@ -0,0 +1,48 @@
+from time_zones import TimeZoneIndex, parse_offset, parse_time_zones
+
+
+def offsets(intervals):
+    return [start for start, _ in intervals]
+
+
+def test_parse_offset():
+    assert parse_offset("+5:30") == 330
+    assert parse_offset("UTC−3") == -180
+    assert parse_offset("UTC") == 0
+    assert parse_offset("+0530") == 330
+    assert parse_offset("-9.30") == -570
+    assert parse_offset("abc") is None
+    assert parse_offset("123") is None
+    assert parse_offset("+5:99") is None
+    assert parse_offset("+99") is None
+    assert parse_offset("-13") is None
+    assert parse_offset("+14") == 840
+
+
+def test_parse_standard_and_dst():
+    parsed = parse_time_zones("UTC+2 (EET) Summer (DST) UTC+3 (EEST)")
+    assert offsets(parsed["standard"]) == [120]
+    assert offsets(parsed["dst"]) == [180]
+
+
+def test_parse_range_expands_to_whole_hours():
+    assert offsets(parse_time_zones("UTC−3 to −5")["standard"]) == [-300, -240, -180]
+
+
+def test_parse_bare_offsets_in_list():
+    parsed = parse_time_zones("UTC+1 (CET); UTC−10, −9:30, −9, −8 and +12")
+    assert offsets(parsed["standard"]) == [-600, -570, -540, -480, 60, 720]
+
+
+def test_index_queries():
+    index = TimeZoneIndex([
+        ("Romania", parse_time_zones("UTC+2 (EET) Summer (DST) UTC+3 (EEST)")),
+        ("Russia", parse_time_zones("UTC+2 to +12")),
+        ("India", parse_time_zones("UTC+05:30 (IST)")),
+    ])
+    assert index.at(330) == [{"nume": "India", "tip": "standard"}]
+    assert index.between(-180, 60) == []
+    assert [match["nume"] for match in index.between(300, 360)] == ["India", "Russia"]
+    # At 06:00 UTC it is 09:00 at UTC+3: Russia (standard) and Romania (summer time)
+    assert index.local_time(9 * 60, 6 * 60) == [{"nume": "Romania", "tip": "dst"}, {"nume": "Russia", "tip": "standard"}]
+    assert index.local_time(9 * 60, 6 * 60, kinds=("standard",)) == [{"nume": "Russia", "tip": "standard"}]
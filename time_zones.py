@@ -0,0 +1,210 @@
+import re
+from bisect import bisect_right
+
+# Offsets are stored in minutes east of UTC; the world spans UTC-12:00 to UTC+14:00
+MIN_OFFSET = -12 * 60
+MAX_OFFSET = 14 * 60
+
+_SIGNS = {"+": 1, "-": -1, "−": -1, "–": -1, "±": 1}
+_OFFSET = r"[+\-−–±]\s*\d{1,2}(?:[:.]\d{2})?"
+_RANGE_END = r"(?:\s*(?:to|through|—)\s*(?:UTC|GMT)?\s*(?P<end>" + _OFFSET + r"))?"
+_TIME_ZONE = re.compile(r"(?:UTC|GMT)\s*(?P<start>" + _OFFSET + r")?" + _RANGE_END)
+# Further offsets listed after a UTC token, e.g. "UTC−10 (HST), −9:30, −9 and −8"
+_LIST_ITEM = re.compile(
+    r"(?:\s*\([^)]*\))?\s*(?:[,;/]|\band\b)\s*(?:and\s+)?(?:UTC|GMT)?\s*(?P<start>" + _OFFSET + r")" + _RANGE_END
+)
+_DST_MARKER = re.compile(r"Summer|DST|Daylight", re.IGNORECASE)
+
+
+def parse_offset(text):
+    """
+    Convert an offset such as "+5:30", "−03", "+0530", "UTC+2" or "UTC" to minutes.
+
+    Args:
+        text (str): The offset text.
+
+    Returns:
+        int: The offset in minutes east of UTC, or None if it cannot be parsed
+        or lies outside MIN_OFFSET..MAX_OFFSET.
+    """
+    text = text.strip()
+    text = re.sub(r"^(?:UTC|GMT)\s*", "", text, flags=re.IGNORECASE)
+    if text == "":
+        return 0
+    # Minutes follow a ":" or "." separator, or come after exactly two hour digits ("0530")
+    match = re.fullmatch(r"([+\-−–±]?)\s*(?:(\d{1,2})(?:[:.](\d{2}))?|(\d{2})(\d{2}))", text)
+    if match is None:
+        return None
+    sign, hours, minutes, compact_hours, compact_minutes = match.groups()
+    hours = int(hours or compact_hours)
+    minutes = int(minutes or compact_minutes or 0)
+    if minutes >= 60:
+        return None
+    offset = _SIGNS.get(sign, 1) * (hours * 60 + minutes)
+    if not MIN_OFFSET <= offset <= MAX_OFFSET:
+        return None
+    return offset
+
+
+def _expand_range(start, end):
+    """
+    Return the offsets of an infobox range such as "UTC+2 to +12".
+
+    A range lists the zones in between, not every minute, so it is expanded to
+    its endpoints and the whole-hour offsets between them.
+    """
+    start, end = min(start, end), max(start, end)
+    whole_hours = range(-(-start // 60) * 60, end + 1, 60)
+    return sorted({start, end, *whole_hours})
+
+
+def _parse_intervals(text):
+    offsets = []
+
+    def add(match):
+        start = parse_offset(match.group("start") or "")
+        end = parse_offset(match.group("end")) if match.group("end") else start
+        if start is None or end is None:
+            return
+        for offset in _expand_range(start, end):
+            if MIN_OFFSET <= offset <= MAX_OFFSET and offset not in offsets:
+                offsets.append(offset)
+
+    position = 0
+    while True:
+        match = _TIME_ZONE.search(text, position)
+        if match is None:
+            break
+        add(match)
+        position = match.end()
+        # Keep reading bare offsets that continue a comma- or semicolon-separated list
+        while True:
+            item = _LIST_ITEM.match(text, position)
+            if item is None:
+                break
+            add(item)
+            position = item.end()
+    return [[offset, offset] for offset in sorted(offsets)]
+
+
+def parse_time_zones(text):
+    """
+    Parse the time zone text of an infobox into UTC offset intervals.
+
+    Everything after a "Summer (DST)" marker is read as daylight saving time.
+    Ranges such as "UTC−3 to −5" are expanded to their whole-hour offsets, and
+    bare offsets listed after a UTC token ("UTC−10, −9:30, −9") are included.
+
+    Args:
+        text (str): The time zone text, e.g. "UTC+2 (EET) Summer (DST) UTC+3 (EEST)".
+
+    Returns:
+        dict: Lists of [start, end] intervals in minutes for "standard" and "dst",
+        e.g. {"standard": [[120, 120]], "dst": [[180, 180]]}.
+    """
+    if not text:
+        return {"standard": [], "dst": []}
+    marker = _DST_MARKER.search(text)
+    if marker is None:
+        return {"standard": _parse_intervals(text), "dst": []}
+    return {
+        "standard": _parse_intervals(text[:marker.start()]),
+        "dst": _parse_intervals(text[marker.start():])
+    }
+
+
+def format_offset(minutes):
+    """
+    Format an offset in minutes as text, e.g. 330 -> "UTC+05:30".
+    """
+    sign = "-" if minutes < 0 else "+"
+    hours, minutes = divmod(abs(minutes), 60)
+    return f"UTC{sign}{hours:02d}:{minutes:02d}"
+
+
+class TimeZoneIndex:
+    """
+    Static interval index over the UTC offsets of all countries.
+
+    The offset axis is cut at every interval boundary into elementary segments,
+    and each segment stores the (country, kind) pairs covering it. A point
+    query is one binary search and a range query is a slice of segments.
+    """
+
+    def __init__(self, countries):
+        """
+        Build the index.
+
+        Args:
+            countries (iterable): Pairs of (country name, parsed time zones) as
+                returned by `parse_time_zones`.
+        """
+        intervals = []
+        for country, time_zones in countries:
+            for kind in ("standard", "dst"):
+                for start, end in time_zones.get(kind, []):
+                    intervals.append((start, end, country, kind))
+
+        # Segments are half-open [boundaries[i], boundaries[i + 1]) over integer minutes
+        self.boundaries = sorted({start for start, _, _, _ in intervals} | {end + 1 for _, end, _, _ in intervals})
+        self.segments = [set() for _ in self.boundaries]
+        for start, end, country, kind in intervals:
+            first = bisect_right(self.boundaries, start) - 1
+            last = bisect_right(self.boundaries, end) - 1
+            for i in range(first, last + 1):
+                self.segments[i].add((country, kind))
+
+    def _segment(self, offset):
+        i = bisect_right(self.boundaries, offset) - 1
+        return i if 0 <= i < len(self.segments) else None
+
+    @staticmethod
+    def _result(matches):
+        return [{"nume": country, "tip": kind} for country, kind in sorted(matches)]
+
+    def at(self, offset):
+        """
+        Return the countries using the given offset (in minutes).
+        """
+        i = self._segment(offset)
+        return self._result(self.segments[i] if i is not None else ())
+
+    def between(self, start, end):
+        """
+        Return the countries using any offset in [start, end] (in minutes).
+        """
+        if start > end or not self.boundaries:
+            return []
+        first = max(bisect_right(self.boundaries, start) - 1, 0)
+        last = min(bisect_right(self.boundaries, end) - 1, len(self.segments) - 1)
+        return self._result(set().union(*self.segments[first:last + 1]))
+
+    def local_time(self, local_minutes, utc_minutes, window=60, kinds=("standard", "dst")):
+        """
+        Return the countries where the local time is currently in
+        [local_minutes, local_minutes + window).
+
+        Standard and summer (DST) offsets are matched independently, because
+        the parsed data does not say when summer time is in effect; restrict
+        `kinds` to match only one of them.
+
+        Args:
+            local_minutes (int): The local time of day, in minutes after midnight.
+            utc_minutes (int): The current UTC time of day, in minutes after midnight.
+            window (int): Width of the local time window, in minutes.
+            kinds (tuple): The offset kinds to match, "standard" and/or "dst".
+
+        Returns:
+            list: Dictionaries with the country name and the offset kind.
+        """
+        matches = set()
+        start = local_minutes - utc_minutes
+        # The required offset is only known modulo one day
+        for shift in (-1440, 0, 1440):
+            low = max(start + shift, MIN_OFFSET)
+            high = min(start + shift + window - 1, MAX_OFFSET)
+            if low <= high:
+                matches.update(
+                    (match["nume"], match["tip"]) for match in self.between(low, high) if match["tip"] in kinds
+                )
+        return self._result(matches)
@@ -2,7 +2,9 @@ import requests
 from bs4 import BeautifulSoup
 import csv
 import psycopg2
+from psycopg2.extras import Json
 from decimal import Decimal
+from time_zones import parse_time_zones
 
 # Connection parameters for the PostgreSQL database
 connection_params = {
@@ -98,6 +100,8 @@ def extract_data(url):
             new_data["Capital"] = capital_name
         if "Time zone" in key:
             new_data["Time zone(s)"] = data[key]
+        if "Summer" in key:
+            new_data["Summer (DST)"] = data[key]
         if "Government" in key:
             # remove the text between [] (including [])
             government = data[key]
@@ -170,7 +174,6 @@ def extract_data(url):
 
             new_data["Area"] = area
 
-
     return new_data
 
 def find_neighbours(country):
@@ -235,15 +238,23 @@ def insert_into_database(country, data_dict):
                 limba_vorbita VARCHAR(255),
                 fus_orar VARCHAR(255),
                 tip_regim VARCHAR(255),
-                vecini VARCHAR(1000)
+                vecini VARCHAR(1000),
+                fusuri_utc JSONB
             );
         """)
+        cursor.execute("ALTER TABLE countries ADD COLUMN IF NOT EXISTS fusuri_utc JSONB;")
 
         # Convertim variabilele numerice înainte de inserare
         populatie = convert_to_numeric(data_dict.get('Population', ''))
         densitate = convert_to_numeric(data_dict.get('Population density', ''))
         area =  convert_to_numeric(data_dict.get('Area', ''))
         gdp = convert_to_numeric(data_dict.get('GDP (PPP)', ''))
+        # Parse the time zone text into UTC offset intervals (in minutes); the DST
+        # row only goes into fusuri_utc so fus_orar keeps the original infobox text
+        time_zones = data_dict.get('Time zone(s)', '')
+        if data_dict.get('Summer (DST)'):
+            time_zones += " Summer (DST) " + data_dict['Summer (DST)']
+        fusuri_utc = parse_time_zones(time_zones)
         # if we have both area and population, we can calculate the density
         if (populatie != 0 and area != 0) or densitate == 0:
             densitate = populatie / area
@@ -251,8 +262,8 @@ def insert_into_database(country, data_dict):
         # Insert data into the table
         cursor.execute("""
             INSERT INTO countries (
-                nume, nume_capitala, populatie, densitate, area, gdp, limba_vorbita, fus_orar, tip_regim, vecini
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
+                nume, nume_capitala, populatie, densitate, area, gdp, limba_vorbita, fus_orar, tip_regim, vecini, fusuri_utc
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
         """, (
             country,
             data_dict.get('Capital', ''),
@@ -264,7 +275,8 @@ def insert_into_database(country, data_dict):
             data_dict.get('Official languages', ''),
             data_dict.get('Time zone(s)', ''),
             data_dict.get('Government', ''),
-            ', '.join(data_dict.get('Neighbors', []))
+            ', '.join(data_dict.get('Neighbors', [])),
+            Json(fusuri_utc)
         ))
 
         connection.commit()